@@ -7,24 +7,23 @@ class Game:
     """Главный игровой класс. Управляет окном, циклами, вводом и игрой."""
     def __init__(self):
         """
-        Инициализирует окно, заголовок и игровой таймер.
+        Инициализирует окно и заголовок.
 
         Creates:
             screen (pygame.Surface): главное окно игры.
-            clock (pygame.time.Clock): используется для ограничения FPS.
+            click_handlers (dict[int, callable]): обработчики кликов по номеру кнопки мыши.
         """
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption(TITLE)
-        self.clock = pygame.time.Clock()
+        self.click_handlers = {1: self._left_click, 3: self._right_click}
 
     def new(self):
         """
         Создаёт новое игровое поле.
 
-        Создаёт объект Board и выводит его содержимое в консоль (для отладки).
+        Создаёт пустой объект Board. Мины расставляются при первом клике.
         """
         self.board = Board()
-        self.board.display_board()
 
     def run(self):
         """
@@ -35,13 +34,23 @@ class Game:
             перерисовкой экрана
             проверкой состояния (проигрыш/победа)
 
+        Цикл не крутится с постоянной частотой кадров: pygame.event.wait()
+        блокирует программу до прихода события, а экран перерисовывается
+        только если состояние поля изменилось.
+
         Когда игра заканчивается — вызывает end_screen().
         """
         self.playing = True
+        self.dirty_frame = False
+        self.draw()
         while self.playing:
-            self.clock.tick(FPS)
-            self.events()
-            self.draw()
+            events = [pygame.event.wait()] # ждёт первое событие
+            events += pygame.event.get() # забирает остальные из очереди одним вызовом
+            for event in events:
+                self._handle_event(event)
+            if self.dirty_frame:
+                self.draw()
+                self.dirty_frame = False
         else:
             self.end_screen()
 
@@ -66,74 +75,79 @@ class Game:
         Returns:
             bool: True, если все незаминированные клетки открыты.
         """
-        for row in self.board.board_list:
-            for tile in row:
-                if tile.type != "X" and not tile.revealed:
-                    return False
-        return True
+        return self.board.unrevealed_safe == 0
 
-    def events(self):
+    def _handle_event(self, event):
         """
-        Обрабатывает все события pygame.
+        Обрабатывает одно событие pygame.
+
+        Args:
+            event (pygame.event.Event): событие из очереди.
 
         Реагирует на:
             выход из игры (QUIT)
             левый клик (открытие клетки)
             правый клик (установка/снятие флага)
+            перекрытие окна (нужна перерисовка)
             завершение игры (проигрыш или победа)
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                quit(0)
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            quit(0)
 
-            if event.type == pygame.MOUSEBUTTONDOWN: # событие нажатия кнопки мыши
-                mx, my = pygame.mouse.get_pos() # возвращает координаты мыши в пикселях
-                mx //= TILESIZE
-                my //= TILESIZE # получаем индексы клетки на поле
-
-                if event.button == 1:
-                    if not self.board.board_list[mx][my].flagged:
-                        # функция открытия клетки, срабатывает при взрыве
-                        if not self.board.dig(mx, my): # ==True
-                            # обработка взрыва
-                            # mx, my — координаты клетки, на которой взорвалась мина
-                            for row in self.board.board_list:
-                                for tile in row:
-                                    if tile.type == "X":
-                                        if tile.flagged:
-                                            # правильно отмеченная мина — оставляем флаг
-                                            continue
-                                        elif tile == self.board.board_list[mx][my]:
-                                            # мина, на которой взорвался клик
-                                            tile.revealed = True
-                                            tile.flagged = False
-                                            tile.image = tile_exploded
-                                        else:
-                                            # остальные мины без флага
-                                            tile.revealed = True
-                                            tile.flagged = False
-                                            tile.image = tile_mine
-                                    elif tile.flagged:
-                                        # неправильные флаги
-                                        tile.revealed = True
-                                        tile.flagged = False
-                                        tile.image = tile_not_mine
-                            # завершаем игру
-                            self.playing = False
-
-                if event.button == 3:
-                    # переключает флаг, но только если тайл ещё не раскрыт
-                    if not self.board.board_list[mx][my].revealed:
-                        self.board.board_list[mx][my].flagged = not self.board.board_list[mx][my].flagged
-
-                if self.check_win():
-                    self.win = True
-                    self.playing = False
-                    for row in self.board.board_list:
-                        for tile in row:
-                            if not tile.revealed: # для всех нераскрытых ячеек
-                                tile.flagged = True # показывает, что все оставшиеся — мины
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED): # окно нужно нарисовать заново
+            self.dirty_frame = True
+
+        if event.type == pygame.MOUSEBUTTONDOWN: # событие нажатия кнопки мыши
+            self.dirty_frame = True
+            mx, my = event.pos # координаты мыши в пикселях в момент клика
+            mx //= TILESIZE
+            my //= TILESIZE # получаем индексы клетки на поле
+
+            handler = self.click_handlers.get(event.button)
+            if handler:
+                handler(mx, my)
+
+            if self.check_win():
+                self.win = True
+                self.playing = False
+                self.board.flag_mines() # показывает, что все оставшиеся — мины
+
+    def _left_click(self, mx, my):
+        """
+        Открывает клетку под курсором.
+
+        При первом открытии клетки сначала расставляет мины и подсказки.
+
+        Args:
+            mx (int): координата клетки по X.
+            my (int): координата клетки по Y.
+        """
+        if self.board.board_list[mx][my].flagged:
+            return # клик по флажку ничего не открывает и не расставляет мины
+
+        if not self.board.mines:
+            # первый клик: мины расставляются вокруг, но не рядом с ним
+            self.board.place_mines(exclude=(mx, my))
+            self.board.place_clues() # для заполнения поля
+            self.board.display_board() # выводит поле в консоль (для отладки)
+
+        # функция открытия клетки, срабатывает при взрыве
+        if not self.board.dig(mx, my): # ==True
+            # обработка взрыва: показывает мины и неправильные флаги
+            self.board.reveal_mines(mx, my)
+            # завершаем игру
+            self.playing = False
+
+    def _right_click(self, mx, my):
+        """
+        Ставит или снимает флажок на клетке под курсором.
+
+        Args:
+            mx (int): координата клетки по X.
+            my (int): координата клетки по Y.
+        """
+        self.board.toggle_flag(mx, my)
 
     def end_screen(self):
         """
@@ -146,19 +160,20 @@ class Game:
             Закрытие окна завершает программу.
         """
         while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    quit(0)
+            event = pygame.event.wait() # не нагружает процессор, пока игрок не кликнет
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                quit(0)
 
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    return
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                return
 
 
-game = Game()
-while True:
-    game.new()
-    game.run()
+if __name__ == "__main__":
+    game = Game()
+    while True:
+        game.new()
+        game.run()
 
 
 
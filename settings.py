@@ -30,7 +30,6 @@ COLS = 15 # размеры поля
 AMOUNT_MINES = 5 # число мин
 WIDTH = TILESIZE * ROWS
 HEIGHT = TILESIZE * COLS # размеры окна
-FPS = 60
 TITLE = "Minesweeper Clone"
 
 tile_numbers = [] # список изображений с цифрами
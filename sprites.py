@@ -1,4 +1,5 @@
 import random
+from collections import Counter, deque
 
 import pygame
 from settings import *
@@ -10,11 +11,13 @@ class Tile:
     Attributes:
         x (int): позиция клетки по X в пикселях.
         y (int): позиция клетки по Y в пикселях.
+        pos (tuple[int, int]): (x, y) — готовая позиция для blit.
         image (pygame.Surface): текущее изображение клетки.
         type (str): тип клетки:
             "." — неизвестная (пустая до генерации)
             "X" — мина
             "C" — цифра (подсказка)
+            "#" — граница за пределами поля
         revealed (bool): открыта ли клетка.
         flagged (bool): помечена ли флажком.
     """
@@ -31,26 +34,34 @@ class Tile:
             flagged (bool): помечена ли флажком.
         """
         self.x, self.y = x * TILESIZE, y * TILESIZE # позиция в пикселях
+        self.pos = (self.x, self.y) # кортеж создаётся один раз, а не при каждой отрисовке
         self.image = image # текущее изображение
         self.type = type # логическое значение тайла
         self.revealed = revealed # раскрыт ли тайл
         self.flagged = flagged # поставлен ли флаг
 
-    def draw(self, board_surface):
+    def get_image(self, _flag=tile_flag, _unknown=tile_unknown):
         """
-        Рисует клетку на поверхности игрового поля.
+        Выбирает изображение клетки по её состоянию.
+
+        Картинки передаются аргументами по умолчанию, чтобы в частом
+        вызове они читались как локальные переменные, а не глобальные.
 
         Отображение зависит от состояния клетки:
             закрытая → TileUnknown
             открытая → своё изображение
             флажок → TileFlag
+
+        Returns:
+            pygame.Surface | None: картинка или None, если клетка не рисуется.
         """
         if not self.flagged and self.revealed:
-            board_surface.blit(self.image, (self.x, self.y))
+            return self.image
         elif self.flagged and not self.revealed:
-            board_surface.blit(tile_flag, (self.x, self.y))
+            return _flag
         elif not self.revealed:
-            board_surface.blit(tile_unknown, (self.x, self.y))
+            return _unknown
+        return None
 
     def __repr__(self):
         """
@@ -70,139 +81,217 @@ class Board:
         генерацией мин
         расчётом подсказок
         открытием клеток
-        рекурсивным открытием пустых областей
+        открытием пустых областей
         отрисовкой поля
     """
     def __init__(self):
         """
-        Создаёт пустое поле, размещает мины и вычисляет подсказки.
+        Создаёт пустое поле.
+
+        Мины и подсказки появляются только после первого клика
+        (см. place_mines), чтобы первый ход никогда не попадал на мину.
 
         Creates:
             board_surface (pygame.Surface): поверхность для рисования поля.
-            board_list (list[list[Tile]]): матрица клеток.
-            dug (list[tuple]): список уже открытых клеток (для защиты от бесконечной рекурсии).
+            board_list (list[list[Tile]]): матрица клеток с граничной колонкой и строкой.
+            mines (list[tuple]): координаты всех мин.
+            flags (set[tuple]): координаты клеток, помеченных флажком.
+            dug (set[tuple]): множество уже открытых клеток (чтобы не открывать клетку повторно).
+            dirty (set[tuple]): клетки, изменившиеся с последней отрисовки.
+            unrevealed_safe (int): сколько клеток без мин ещё не открыто.
         """
         self.board_surface = pygame.Surface((WIDTH, HEIGHT)) # вспомогательная поверхность, на ней рисуются все тайлы
-        self.board_list = [[Tile(col, row, tile_empty, ".") for row in range(ROWS)] for col in range(COLS)] # двоичный список: внешний цикл по колонкам, внутренний — по строкам
-        self.place_mines()
-        self.place_clues() # для заполнения поля
-        self.dug = [] # список уже «вскрытых» координат
-
-    def place_mines(self):
+        self.board_surface.fill(DARKGREY) # фон заливается один раз, дальше перерисовываются только изменённые тайлы
+        # двоичный список: внешний цикл по колонкам, внутренний — по строкам
+        # последняя колонка и последняя строка — граница "#"; индексы -1, COLS и ROWS попадают в неё,
+        # поэтому соседей можно перебирать без проверок выхода за пределы поля
+        border = Tile(COLS, ROWS, tile_empty, "#", revealed=True)
+        self.board_list = [[Tile(col, row, tile_empty, ".") for row in range(ROWS)] + [border] for col in range(COLS)]
+        self.board_list.append([border] * (ROWS + 1))
+        self.mines = [] # координаты размещённых мин, пусто до первого клика
+        self.flags = set() # координаты флажков
+        self.dug = set() # множество уже «вскрытых» координат
+        self.dirty = {(x, y) for x in range(COLS) for y in range(ROWS)} # при первой отрисовке рисуется всё поле
+        self.unrevealed_safe = COLS * ROWS - AMOUNT_MINES # когда станет 0 — игрок победил
+
+    def place_mines(self, exclude):
         """
         Размещает мины случайным образом на поле.
 
+        Все позиции выбираются одним вызовом random.sample без повторов,
+        поэтому повторные попытки на занятых клетках не нужны.
+
+        Args:
+            exclude (tuple[int, int]): клетка первого клика; в квадрате 3×3
+                вокруг неё мин не будет. Если вне квадрата не хватает клеток
+                для AMOUNT_MINES мин, исключается только сама клетка.
+
         Гарантирует:
             не кладёт мину на уже занятую клетку
+            не кладёт мину на клетку первого клика
             общее число мин = AMOUNT_MINES
         """
-        for _ in range(AMOUNT_MINES):
-            while True:
-                x = random.randint(0, COLS-1)
-                y = random.randint(0, ROWS-1)
-
-                if self.board_list[x][y].type == ".":
-                    self.board_list[x][y].image = tile_mine
-                    self.board_list[x][y].type = "X"
-                    break
+        ex, ey = exclude
+        candidates = [index for index in range(COLS * ROWS)
+                      if abs(index // ROWS - ex) > 1 or abs(index % ROWS - ey) > 1] # все клетки вне квадрата 3×3
+        if len(candidates) < AMOUNT_MINES: # слишком плотное поле — убираем только клетку клика
+            candidates = [index for index in range(COLS * ROWS) if index != ex * ROWS + ey]
+        for index in random.sample(candidates, AMOUNT_MINES):
+            x, y = divmod(index, ROWS) # номер клетки → координаты
+            self.board_list[x][y].image = tile_mine
+            self.board_list[x][y].type = "X"
+            self.mines.append((x, y))
 
     def place_clues(self):
         """
         Вычисляет число мин вокруг каждой клетки.
 
+        Вместо обхода соседей каждой клетки каждая мина добавляет
+        единицу всем клеткам в своём квадрате 3×3. Затем обновляются
+        только эти клетки, без прохода по всему полю.
+
         Если рядом ≥ 1 мины:
             клетка становится подсказкой "C"
             выбирается нужная картинка с цифрой
         """
-        for x in range(COLS):
-            for y in range(ROWS):
-                if self.board_list[x][y].type != "X":
-                    total_mines = self.check_neighbours(x, y)
-                    if total_mines > 0:
-                        self.board_list[x][y].image = tile_numbers[total_mines-1]
-                        self.board_list[x][y].type = "C"
+        board_list, numbers = self.board_list, tile_numbers # локальные имена для горячих циклов
+        counts = Counter() # число мин рядом; только для клеток, у которых оно > 0
+        for mx, my in self.mines:
+            for nx in range(mx-1, mx+2):
+                for ny in range(my-1, my+2):
+                    counts[nx, ny] += 1
+
+        for (x, y), total_mines in counts.items():
+            tile = board_list[x][y]
+            if tile.type == ".": # не мина и не граница
+                tile.image = numbers[total_mines-1]
+                tile.type = "C"
 
-
-    @staticmethod
-    def is_inside(x, y):
+    def draw(self, screen):
         """
-        Проверяет, находится ли клетка в пределах поля.
+        Рисует игровое поле на экран.
 
-        Args:
-            x (int): координата по X.
-            y (int): координата по Y.
+        На board_surface перерисовываются только клетки из dirty,
+        остальные остаются с прошлых кадров. Все изменённые тайлы
+        передаются в pygame одним вызовом blits().
 
-        Returns:
-            bool: True если клетка внутри поля.
+        Args:
+            screen (pygame.Surface): главное окно игры.
         """
-        return 0 <= x < COLS and 0 <= y < ROWS
+        board_list, board_surface, tilesize = self.board_list, self.board_surface, TILESIZE # локальные имена для цикла
+        pairs = [] # пары (картинка, позиция) для blits
+        add_pair = pairs.append
+        for x, y in self.dirty:
+            tile = board_list[x][y]
+            image = tile.get_image()
+            if image is None:
+                # картинки тайлов непрозрачные и сами перекрывают старое изображение,
+                # фоном закрашиваются только клетки, которые не рисуются
+                board_surface.fill(DARKGREY, (tile.x, tile.y, tilesize, tilesize))
+            else:
+                add_pair((image, tile.pos))
+        board_surface.blits(pairs, doreturn=False)
+        self.dirty.clear()
+        screen.blit(board_surface, (0, 0)) # Копирует финальную поверхность на экран.
 
-    def check_neighbours(self, x, y):
+    def dig(self, x, y):
         """
-        Считает количество мин вокруг данной клетки.
+        Открывает клетку и итеративно открывает прилегающие пустые области.
 
         Args:
-            x (int): координата клетки.
-            y (int): координата клетки.
+            x (int): координата по X.
+            y (int): координата по Y.
 
         Returns:
-            int: число мин рядом.
+            bool:
+                True — если всё нормально.
+                False — если игрок попал на мину (проигрыш).
         """
-        total_mines = 0
-        for x_offset in range(-1, 2):
-            for y_offset in range(-1, 2):
-                neighbour_x = x + x_offset
-                neighbour_y = y + y_offset
-                if self.is_inside(neighbour_x, neighbour_y) and self.board_list[neighbour_x][neighbour_y].type == "X":
-                    total_mines += 1
-
-        return total_mines
+        board_list, dug, dirty = self.board_list, self.dug, self.dirty # локальные имена для цикла
+        stack = deque([(x, y)]) # клетки, ожидающие открытия
+        push = stack.append
+        while stack:
+            cx, cy = stack.pop()
+            tile = board_list[cx][cy]
+            if tile.type == "#" or (cx, cy) in dug: # граница или уже вскрытая клетка
+                continue
+            dug.add((cx, cy)) # отмечает, что клетка вскрыта
+            dirty.add((cx, cy))
+            if tile.type == "X": # Если это мина
+                tile.revealed = True
+                tile.image = tile_exploded
+                return False # произошёл взрыв
+            if not tile.revealed:
+                tile.revealed = True
+                self.unrevealed_safe -= 1
+            if tile.type == "C": # Если это подсказка — соседей не открываем
+                continue
+
+            # пустая клетка: добавляет в очередь всех соседей в квадрате 3×3
+            # при клике по пустому месту раскрываются все прилегающие пустые клетки и подсказки
+            for nx in range(cx-1, cx+2):
+                for ny in range(cy-1, cy+2):
+                    if (nx, ny) not in dug:
+                        push((nx, ny))
+        return True
 
-    def draw(self, screen):
+    def reveal_mines(self, x, y):
         """
-        Рисует всё игровое поле на экран.
+        Показывает поле после взрыва.
+
+        Обходит только мины и флажки, каждую клетку — одной цепочкой if/elif:
+            правильно отмеченная мина — флаг остаётся
+            мина, на которой взорвался клик — TileExploded
+            остальные мины без флага — TileMine
+            неправильные флаги — TileNotMine, клетка убирается из flags
 
         Args:
-            screen (pygame.Surface): главное окно игры.
+            x (int): координата клетки, на которой взорвалась мина.
+            y (int): координата клетки, на которой взорвалась мина.
         """
-        self.board_surface.fill(DARKGREY) # Очищает board_surface фоном
+        for cx, cy in self.flags.union(self.mines):
+            tile = self.board_list[cx][cy]
+            if tile.type == "X" and tile.flagged:
+                continue
+            elif tile.type == "X":
+                tile.revealed = True
+                tile.image = tile_exploded if (cx, cy) == (x, y) else tile_mine
+            else:
+                tile.revealed = True
+                tile.flagged = False
+                self.flags.discard((cx, cy))
+                tile.image = tile_not_mine
+            self.dirty.add((cx, cy))
+
+    def flag_mines(self):
+        """
+        Ставит флажки на все мины после победы.
 
-        for row in self.board_list:
-            for tile in row:
-                tile.draw(self.board_surface)
-        screen.blit(self.board_surface, (0, 0)) # Копирует финальную поверхность на экран.
+        После победы закрытыми остаются только мины, поэтому обходятся
+        только они; множество flags обновляется вместе с клетками.
+        """
+        for x, y in self.mines:
+            self.board_list[x][y].flagged = True
+            self.flags.add((x, y))
+            self.dirty.add((x, y))
 
-    def dig(self, x, y):
+    def toggle_flag(self, x, y):
         """
-        Открывает клетку и управляет рекурсивным открытием пустых областей.
+        Ставит или снимает флажок, но только если клетка ещё не раскрыта.
 
         Args:
             x (int): координата по X.
             y (int): координата по Y.
-
-        Returns:
-            bool:
-                True — если всё нормально.
-                False — если игрок попал на мину (проигрыш).
         """
-        self.dug.append((x, y)) # отмечает, что клетка вскрыта
-        if self.board_list[x][y].type == "X": # Если это мина
-            self.board_list[x][y].revealed = True
-            self.board_list[x][y].image = tile_exploded
-            return False # произошёл взрыв
-        elif self.board_list[x][y].type == "C": # Если это подсказка
-            self.board_list[x][y].revealed = True
-            return True
-
-        self.board_list[x][y].revealed = True # пустая клетка
-
-        # рекурсивно вызывает dig для всех соседних клеток в квадрате 3×3
-        # при клике по пустому месту раскрываются все прилегающие пустые клетки и подсказки
-        for nx in range(max(0, x-1), min(COLS-1, x+1) + 1):
-            for ny in range(max(0, y-1), min(ROWS-1, y+1) + 1):
-                if (nx, ny) not in self.dug:
-                    self.dig(nx, ny)
-        return True
+        tile = self.board_list[x][y]
+        if tile.revealed:
+            return
+        tile.flagged ^= True
+        if tile.flagged:
+            self.flags.add((x, y))
+        else:
+            self.flags.discard((x, y))
+        self.dirty.add((x, y))
 
     def display_board(self):
         """
@@ -210,6 +299,6 @@ class Board:
 
         Использует __repr__() у Tile.
         """
-        for row in self.board_list:
-            print(row)
+        for row in self.board_list[:COLS]: # без граничной колонки
+            print(row[:ROWS])
 